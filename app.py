@@ -1,16 +1,47 @@
 from __future__ import annotations
 
 import base64
+import functools
 import html
 import json
+import mmap
+import os
 import sys
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
+from itertools import islice
 import shutil
+import string
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Callable, Iterable, List
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+try:
+    import pybase64 as b64codec
+except ImportError:
+    b64codec = base64
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+IMAGE_FIELDS = (
+    ("front", "主图正面"),
+    ("back", "主图背面"),
+    ("detail1", "细节图一"),
+    ("detail2", "细节图二"),
+)
+IMAGE_KEYS = tuple(key for key, _ in IMAGE_FIELDS)
+
+# Multiple of 3 so every chunk encodes without padding and the parts concatenate cleanly.
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+_MMAP_THRESHOLD = 64 * 1024
+# Data URIs are whole base64 photos, so the cache is bounded by size rather than entry count.
+_DATA_URI_CACHE_BYTES = 32 * 1024 * 1024
+
 
 @dataclass
 class DescriptionBlock:
@@ -33,14 +64,506 @@ class BridalEntry:
     raw_metadata: Any | None = None
 
 
+def _json_loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+class _DataUriCache:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, int, int]) -> str | None:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[str, int, int], value: str) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._items:
+                return
+            self._items[key] = value
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+
+_data_uri_cache = _DataUriCache(_DATA_URI_CACHE_BYTES)
+
+
+def _encode_file(path_str: str, mtime_ns: int, size: int) -> str:
+    key = (path_str, mtime_ns, size)
+    uri = _data_uri_cache.get(key)
+    if uri is None:
+        uri = _read_data_uri(path_str, size)
+        _data_uri_cache.put(key, uri)
+    return uri
+
+
+def _read_data_uri(path_str: str, size: int) -> str:
+    path = Path(path_str)
+    with path.open("rb") as fh:
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                parts = [
+                    b64codec.b64encode(view[start : start + _B64_CHUNK_SIZE])
+                    for start in range(0, len(view), _B64_CHUNK_SIZE)
+                ]
+        else:
+            parts = [b64codec.b64encode(fh.read())]
+    encoded = b"".join(parts).decode("ascii")
+    suffix = path.suffix.lower().strip(".") or "jpeg"
+    return f"data:image/{suffix};base64,{encoded}"
+
+
+@functools.lru_cache(maxsize=2048)
+def _render_inline(value: str) -> str:
+    return html.escape(value, quote=True) if value else ""
+
+
+@functools.lru_cache(maxsize=2048)
+def _render_paragraph(value: str) -> str:
+    if not value:
+        return ""
+    return html.escape(value, quote=True).replace("\n", "<br />")
+
+
+def _preview_cache_key(path: str, size: QtCore.QSize) -> str | None:
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return f"{path}|{mtime_ns}|{size.width()}x{size.height()}"
+
+
+def _read_preview_image(path: str, size: QtCore.QSize, device_pixel_ratio: float = 1.0) -> QtGui.QImage:
+    reader = QtGui.QImageReader(path)
+    reader.setAutoTransform(True)
+    original = reader.size()
+    if original.isValid():
+        reader.setScaledSize(original.scaled(size, QtCore.Qt.KeepAspectRatio))
+    image = reader.read()
+    if not image.isNull() and not image.hasAlphaChannel() and image.format() != QtGui.QImage.Format_RGB32:
+        image = image.convertToFormat(QtGui.QImage.Format_RGB32)
+    image.setDevicePixelRatio(device_pixel_ratio)
+    return image
+
+
+class PreviewSignals(QtCore.QObject):
+    loaded = QtCore.pyqtSignal(str, int, str, QtGui.QImage)
+
+
+class PreviewLoader(QtCore.QRunnable):
+    def __init__(
+        self,
+        signals: PreviewSignals,
+        tokens: dict[str, int],
+        key: str,
+        token: int,
+        path: str,
+        cache_key: str,
+        size: QtCore.QSize,
+        device_pixel_ratio: float,
+    ) -> None:
+        super().__init__()
+        self.signals = signals
+        self.tokens = tokens
+        self.key = key
+        self.token = token
+        self.path = path
+        self.cache_key = cache_key
+        self.size = QtCore.QSize(size)
+        self.device_pixel_ratio = device_pixel_ratio
+
+    def run(self) -> None:
+        # Skip decodes superseded while queued, e.g. when scrolling quickly through the list.
+        if self.tokens.get(self.key) != self.token:
+            return
+        image = _read_preview_image(self.path, self.size, self.device_pixel_ratio)
+        self.signals.loaded.emit(self.key, self.token, self.cache_key, image)
+
+
+def _make_image_dialog(parent: QtWidgets.QWidget) -> QtWidgets.QFileDialog:
+    dialog = QtWidgets.QFileDialog(parent, "选择图片")
+    dialog.setNameFilter("Images (*.png *.jpg *.jpeg)")
+    dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+    return dialog
+
+
+class ExportSignals(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int)
+    finished = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+
+class ExportWorker(QtCore.QRunnable):
+    def __init__(
+        self,
+        entries: List[BridalEntry],
+        output_file: str,
+        render: Callable[[BridalEntry], str],
+        head: str,
+        tail: str,
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.entries = entries
+        self.output_file = output_file
+        self.render = render
+        self.head = head
+        self.tail = tail
+        self.signals = ExportSignals()
+
+    def run(self) -> None:
+        # Imported here: concurrent.futures pulls in logging and threading, and only export needs it.
+        from concurrent.futures import ThreadPoolExecutor
+
+        try:
+            workers = min(8, os.cpu_count() or 4)
+            with open(self.output_file, "w", encoding="utf-8", buffering=1 << 20) as fh, ThreadPoolExecutor(
+                max_workers=workers
+            ) as executor:
+                fh.write(self.head)
+                remaining = iter(self.entries)
+                # Keep only a small window of pages in flight so memory stays bounded.
+                pending = deque(executor.submit(self.render, entry) for entry in islice(remaining, workers * 2))
+                idx = 0
+                while pending:
+                    page = pending.popleft().result()
+                    next_entry = next(remaining, None)
+                    if next_entry is not None:
+                        pending.append(executor.submit(self.render, next_entry))
+                    fh.write(page)
+                    idx += 1
+                    self.signals.progress.emit(idx)
+                fh.write(self.tail)
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(self.output_file)
+
+
+class EntryModel(QtCore.QAbstractListModel):
+    ENTRY_ROLE = QtCore.Qt.UserRole
+    MIME_TYPE = "application/x-bridal-entry-row"
+
+    def __init__(self, main_window: "MainWindow") -> None:
+        super().__init__(main_window)
+        self.main_window = main_window
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.main_window.entries)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self.main_window.entries):
+            return None
+        entry = self.main_window.entries[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return entry.slug
+        if role == self.ENTRY_ROLE:
+            return entry
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        flags = super().flags(index)
+        if index.isValid():
+            return flags | QtCore.Qt.ItemIsDragEnabled
+        return flags | QtCore.Qt.ItemIsDropEnabled
+
+    def supportedDropActions(self) -> QtCore.Qt.DropActions:
+        return QtCore.Qt.MoveAction
+
+    def mimeTypes(self) -> List[str]:
+        return [self.MIME_TYPE]
+
+    def mimeData(self, indexes: List[QtCore.QModelIndex]) -> QtCore.QMimeData:
+        mime = QtCore.QMimeData()
+        if indexes:
+            mime.setData(self.MIME_TYPE, QtCore.QByteArray(str(indexes[0].row()).encode("ascii")))
+        return mime
+
+    def dropMimeData(
+        self,
+        data: QtCore.QMimeData,
+        action: QtCore.Qt.DropAction,
+        row: int,
+        column: int,
+        parent: QtCore.QModelIndex,
+    ) -> bool:
+        if action != QtCore.Qt.MoveAction or not data.hasFormat(self.MIME_TYPE):
+            return False
+        source = int(bytes(data.data(self.MIME_TYPE)).decode("ascii"))
+        if row < 0:
+            row = parent.row() if parent.isValid() else self.rowCount()
+        return self.move_entry(source, row)
+
+    def moveRows(
+        self,
+        source_parent: QtCore.QModelIndex,
+        source_row: int,
+        count: int,
+        destination_parent: QtCore.QModelIndex,
+        destination_child: int,
+    ) -> bool:
+        if count != 1 or source_parent.isValid() or destination_parent.isValid():
+            return False
+        return self.move_entry(source_row, destination_child)
+
+    def insert_entry(self, row: int, entry: BridalEntry) -> None:
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.main_window.entries.insert(row, entry)
+        self.endInsertRows()
+
+    def remove_entry(self, row: int) -> None:
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.main_window.entries[row]
+        self.endRemoveRows()
+
+    def replace_entry(self, row: int, entry: BridalEntry) -> None:
+        self.main_window.entries[row] = entry
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def move_entry(self, source: int, destination: int) -> bool:
+        entries = self.main_window.entries
+        if not 0 <= source < len(entries) or destination in (source, source + 1):
+            return False
+        if not self.beginMoveRows(QtCore.QModelIndex(), source, source, QtCore.QModelIndex(), destination):
+            return False
+        entry = entries.pop(source)
+        entries.insert(destination - 1 if destination > source else destination, entry)
+        self.endMoveRows()
+        return True
+
+
+class EntryDelegate(QtWidgets.QStyledItemDelegate):
+    ROW_HEIGHT = 48
+    ACTION_SIZE = QtCore.QSize(48, 30)
+    ACTIONS = (("edit", "编辑"), ("delete", "删除"))
+    ACTION_COLOR = QtGui.QColor("#4f6ef7")
+    ACTION_HOVER_COLOR = QtGui.QColor("#2b4b85")
+    ACTION_HOVER_BACKGROUND = QtGui.QColor(79, 110, 247, 31)
+
+    def __init__(self, main_window: "MainWindow") -> None:
+        super().__init__(main_window)
+        self.main_window = main_window
+        self._base_font: QtGui.QFont | None = None
+        self._label_font = QtGui.QFont()
+        self._label_metrics = QtGui.QFontMetrics(self._label_font)
+        self._action_font = QtGui.QFont()
+        self._hovered: tuple[int, str] | None = None
+
+    def attach(self, view: QtWidgets.QAbstractItemView) -> None:
+        view.setItemDelegate(self)
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() == QtCore.QEvent.MouseMove:
+            self._set_hovered(obj, self._action_at(obj.parent(), event.pos()))
+        elif event.type() == QtCore.QEvent.Leave:
+            self._set_hovered(obj, None)
+        # The viewport is not an editor, so bypass QStyledItemDelegate's editor focus/key handling.
+        return False
+
+    def _action_at(self, view: QtWidgets.QAbstractItemView, pos: QtCore.QPoint) -> tuple[int, str] | None:
+        index = view.indexAt(pos)
+        if not index.isValid():
+            return None
+        for key, rect in self._action_rects(view.visualRect(index)).items():
+            if rect.contains(pos):
+                return index.row(), key
+        return None
+
+    def _set_hovered(self, viewport: QtWidgets.QWidget, hovered: tuple[int, str] | None) -> None:
+        if hovered == self._hovered:
+            return
+        self._hovered = hovered
+        if hovered is None:
+            viewport.unsetCursor()
+        else:
+            viewport.setCursor(QtCore.Qt.PointingHandCursor)
+        viewport.update()
+
+    def _fonts_for(self, base: QtGui.QFont) -> None:
+        if self._base_font is not None and self._base_font == base:
+            return
+        self._base_font = QtGui.QFont(base)
+        self._label_font = QtGui.QFont(base)
+        self._label_font.setWeight(QtGui.QFont.Medium)
+        self._label_metrics = QtGui.QFontMetrics(self._label_font)
+        self._action_font = QtGui.QFont(base)
+        self._action_font.setWeight(QtGui.QFont.DemiBold)
+        self._action_font.setPixelSize(13)
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        hint = super().sizeHint(option, index)
+        hint.setHeight(max(hint.height(), self.ROW_HEIGHT))
+        return hint
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        slug = opt.text
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        action_rects = self._action_rects(option.rect)
+        text_rect = QtCore.QRect(option.rect)
+        text_rect.setLeft(option.rect.left() + 10)
+        text_rect.setRight(min(rect.left() for rect in action_rects.values()) - 8)
+
+        self._fonts_for(opt.font)
+        painter.save()
+        painter.setFont(self._label_font)
+        painter.setPen(opt.palette.color(QtGui.QPalette.Text))
+        elided = self._label_metrics.elidedText(slug, QtCore.Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft, elided)
+
+        hovered_key = None
+        if opt.state & QtWidgets.QStyle.State_MouseOver and self._hovered and self._hovered[0] == index.row():
+            hovered_key = self._hovered[1]
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setFont(self._action_font)
+        for key, text in self.ACTIONS:
+            rect = action_rects[key]
+            if key == hovered_key:
+                painter.setPen(QtCore.Qt.NoPen)
+                painter.setBrush(self.ACTION_HOVER_BACKGROUND)
+                painter.drawRoundedRect(rect, 6, 6)
+                painter.setPen(self.ACTION_HOVER_COLOR)
+            else:
+                painter.setPen(self.ACTION_COLOR)
+            painter.drawText(rect, QtCore.Qt.AlignCenter, text)
+        painter.restore()
+
+    def editorEvent(
+        self,
+        event: QtCore.QEvent,
+        model: QtCore.QAbstractItemModel,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> bool:
+        if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
+            for key, rect in self._action_rects(option.rect).items():
+                if rect.contains(event.pos()):
+                    entry = index.data(EntryModel.ENTRY_ROLE)
+                    callback = self.main_window.edit_entry if key == "edit" else self.main_window.delete_entry
+                    # Defer so the list can finish handling the click before the model is reset.
+                    QtCore.QTimer.singleShot(0, functools.partial(callback, entry))
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def _action_rects(self, rect: QtCore.QRect) -> dict[str, QtCore.QRect]:
+        rects: dict[str, QtCore.QRect] = {}
+        right = rect.right() - 10
+        top = rect.top() + (rect.height() - self.ACTION_SIZE.height()) // 2
+        for key, _ in reversed(self.ACTIONS):
+            action_rect = QtCore.QRect(QtCore.QPoint(right - self.ACTION_SIZE.width() + 1, top), self.ACTION_SIZE)
+            rects[key] = action_rect
+            right = action_rect.left() - 8
+        return rects
+
+
 class MainWindow(QtWidgets.QMainWindow):
     TEMPLATE_DIR_NAME = "template"
+    IMAGE_FILES = {
+        "front": "主图正面.jpg",
+        "back": "主图背面.jpg",
+        "detail1": "细节图一.jpg",
+        "detail2": "细节图二.jpg",
+    }
+    METADATA_FILES = ("信息.json", "信息.txt")
+    PAGE_STYLE = """
+        :root {
+            --ink:#35241a;
+            --accent:#c19273;
+            --veil:#faf3eb;
+        }
+        .page {
+            background:linear-gradient(135deg,#f9f3ec 0%,#f2e5d8 100%);
+            padding:1.8rem;
+            border-radius:26px;
+            display:grid;
+            grid-template-columns:minmax(0,38%) minmax(0,62%);
+            gap:1.2rem;
+            min-height:260px;
+            font-family:'Cormorant Garamond','Palatino Linotype','Times New Roman',serif;
+            color:var(--ink);
+            box-shadow:0 25px 55px rgba(54,34,17,0.12);
+        }
+        .info{display:flex;flex-direction:column;gap:0.9rem;min-height:100%;}
+        .info h2{margin:0;font-size:2.2rem;letter-spacing:0.08em;font-weight:500;}
+        .info p{margin:0 0 0.4rem;font-size:1.05rem;line-height:1.7;}
+        .tag{text-transform:uppercase;letter-spacing:0.5em;font-size:0.75rem;color:rgba(0,0,0,0.45);font-family:'Optima','Cormorant Garamond','Times New Roman',serif;}
+        .photos{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));grid-template-rows:minmax(0,1fr) minmax(0,0.6fr);gap:0.7rem;}
+        figure{margin:0;border-radius:18px;overflow:hidden;position:relative;background:#dcd6cf;box-shadow:0 15px 40px rgba(0,0,0,0.12);}
+        figure img{width:100%;height:100%;object-fit:cover;display:block;}
+        figure figcaption{position:absolute;bottom:8px;left:14px;font-size:0.7rem;letter-spacing:0.2em;color:rgba(255,255,255,0.7);text-shadow:0 2px 6px rgba(0,0,0,0.45);}
+        .price{margin-top:auto;align-self:flex-end;font-size:1.5rem;color:var(--accent);letter-spacing:0.3em;text-transform:uppercase;font-weight:500;}
+        .desc-grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(160px,1fr));gap:0.8rem;}
+        .desc-grid article{background:rgba(255,255,255,0.65);padding:0.9rem;border-radius:18px;box-shadow:0 12px 35px rgba(0,0,0,0.08);}
+        .desc-grid article h3{margin:0 0 0.5rem;font-size:0.9rem;letter-spacing:0.15em;color:var(--accent);text-transform:uppercase;}
+        .desc-grid article p{margin:0;font-size:0.95rem;line-height:1.6;}
+        """
+    PAGE_TEMPLATE = string.Template(
+        """
+        <section class='page'>
+            <div class='info'>
+                <div>
+                    <div class='tag'>$slug</div>
+                    <h2>$name</h2>
+                    $desc
+                </div>
+                <div class='price'>价格 ¥$price</div>
+            </div>
+            <div class='photos'>
+                <figure><img src="$front" alt="$alt 主图正面" /></figure>
+                <figure><img src="$back" alt="$alt 主图背面" /></figure>
+                <figure><img src="$detail1" alt="$alt 细节一" /><figcaption>DETAIL</figcaption></figure>
+                <figure><img src="$detail2" alt="$alt 细节二" /><figcaption>DETAIL</figcaption></figure>
+            </div>
+        </section>
+        """
+    )
+    EXPORT_HEAD = (
+        "<!DOCTYPE html><html lang='zh-CN'><head><meta charset='UTF-8'><title>婚纱目录预览</title>"
+        f"<style>{PAGE_STYLE}</style></head>"
+        "<body style=\"font-family:'PingFang SC','Microsoft Yahei',sans-serif;background:#f4efe7;padding:20px;\">"
+    )
+    EXPORT_TAIL = "</body></html>"
 
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("婚纱目录管理")
         self.resize(1100, 600)
         self.entries: List[BridalEntry] = []
+        self._slug_index: dict[str, int] = {}
+        self._export_worker: ExportWorker | None = None
+        self._export_progress: QtWidgets.QProgressDialog | None = None
         default_root = Path.cwd()
         template_dir = default_root / self.TEMPLATE_DIR_NAME
         template_dir.mkdir(parents=True, exist_ok=True)
@@ -66,10 +589,20 @@ class MainWindow(QtWidgets.QMainWindow):
         path_layout.addWidget(self.path_edit)
         left_panel.addLayout(path_layout)
 
-        self.entry_list = QtWidgets.QListWidget()
+        self.entry_model = EntryModel(self)
+        for signal in (
+            self.entry_model.modelReset,
+            self.entry_model.rowsInserted,
+            self.entry_model.rowsRemoved,
+            self.entry_model.rowsMoved,
+        ):
+            signal.connect(self._reindex_entries)
+        self.entry_list = QtWidgets.QListView()
+        self.entry_list.setModel(self.entry_model)
+        EntryDelegate(self).attach(self.entry_list)
         self.entry_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.entry_list.setDragDropMode(QtWidgets.QAbstractItemView.InternalMove)
-        self.entry_list.currentRowChanged.connect(self.render_preview)
+        self.entry_list.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
         left_panel.addWidget(self.entry_list, 1)
 
         add_btn = QtWidgets.QPushButton("新建产品")
@@ -99,71 +632,103 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "提示", str(exc))
             return
 
+        with os.scandir(template_root) as it:
+            folders = sorted(
+                Path(item.path)
+                for item in it
+                if item.is_dir() and item.name != "模板" and not item.name.startswith(".")
+            )
+
         entries: List[BridalEntry] = []
-        for folder in sorted(template_root.iterdir()):
-            if (
-                not folder.is_dir()
-                or folder.name == "模板"
-                or folder.name.startswith(".")
-            ):
-                continue
-            try:
-                metadata, meta_path, raw_meta = self._load_metadata(folder)
-            except ValueError as exc:
-                QtWidgets.QMessageBox.warning(self, "提示", f"{folder.name}：{exc}")
-                continue
+        for folder in folders:
+            entry = self._read_entry(folder)
+            if entry is not None:
+                entries.append(entry)
+
+        selection_model = self.entry_list.selectionModel()
+        self.entry_list.setUpdatesEnabled(False)
+        selection_model.blockSignals(True)
+        try:
+            self.entry_model.beginResetModel()
+            self.entries = entries
+            self.entry_model.endResetModel()
+        finally:
+            selection_model.blockSignals(False)
+            self.entry_list.setUpdatesEnabled(True)
+        if entries:
+            self._set_current_row(0)
+        else:
+            self.editor.clear()
 
-            name = metadata.get("name") or folder.name
-            desc = metadata.get("description", "")
-            price = metadata.get("price", "")
-            desc_blocks = metadata.get("description_blocks", [])
+    def _read_entry(self, folder: Path) -> BridalEntry | None:
+        try:
+            with os.scandir(folder) as it:
+                file_names = self._index_file_names(item.name for item in it if item.is_file())
+        except OSError:
+            QtWidgets.QMessageBox.warning(self, "提示", f"{folder.name}：无法读取文件夹")
+            return None
+        try:
+            metadata, meta_path, raw_meta = self._load_metadata(folder, file_names)
+        except ValueError as exc:
+            QtWidgets.QMessageBox.warning(self, "提示", f"{folder.name}：{exc}")
+            return None
 
-            images = {
-                "front": folder / "主图正面.jpg",
-                "back": folder / "主图背面.jpg",
-                "detail1": folder / "细节图一.jpg",
-                "detail2": folder / "细节图二.jpg",
-            }
+        name = metadata.get("name") or folder.name
+        desc = metadata.get("description", "")
+        price = metadata.get("price", "")
+        desc_blocks = metadata.get("description_blocks", [])
 
-            missing = [p.name for p, exists in ((path, path.exists()) for path in images.values()) if not exists]
-            if missing:
-                QtWidgets.QMessageBox.warning(
-                    self, "提示", f"{folder.name} 缺少以下图片文件：{', '.join(missing)}"
-                )
-                continue
+        images = {
+            key: folder / file_names.get(file_name.casefold(), file_name)
+            for key, file_name in self.IMAGE_FILES.items()
+        }
 
-            entries.append(
-                BridalEntry(
-                    slug=folder.name,
-                    name=name,
-                    description=desc,
-                    description_blocks=desc_blocks,
-                    price=price,
-                    front=images["front"],
-                    back=images["back"],
-                    detail1=images["detail1"],
-                    detail2=images["detail2"],
-                    metadata_path=meta_path,
-                    raw_metadata=raw_meta,
-                )
+        missing = [file_name for file_name in self.IMAGE_FILES.values() if file_name.casefold() not in file_names]
+        if missing:
+            QtWidgets.QMessageBox.warning(
+                self, "提示", f"{folder.name} 缺少以下图片文件：{', '.join(missing)}"
             )
+            return None
 
-        self.entries = entries
-        self.entry_list.clear()
-        for entry in entries:
-            item = QtWidgets.QListWidgetItem(entry.slug)
-            item.setFlags(item.flags() | QtCore.Qt.ItemIsDragEnabled | QtCore.Qt.ItemIsDropEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled)
-            self.entry_list.addItem(item)
-            widget = self._build_entry_item(entry)
-            hint = widget.sizeHint()
-            hint.setHeight(max(hint.height(), 48))
-            item.setSizeHint(hint)
-            item.setText("")
-            self.entry_list.setItemWidget(item, widget)
-        if entries:
-            self.entry_list.setCurrentRow(0)
-        else:
-            self.editor.clear()
+        return BridalEntry(
+            slug=folder.name,
+            name=name,
+            description=desc,
+            description_blocks=desc_blocks,
+            price=price,
+            front=images["front"],
+            back=images["back"],
+            detail1=images["detail1"],
+            detail2=images["detail2"],
+            metadata_path=meta_path,
+            raw_metadata=raw_meta,
+        )
+
+    @classmethod
+    def _index_file_names(cls, names: Iterable[str]) -> dict[str, str]:
+        # Keyed by casefold so lookups match case-insensitive filesystems (macOS, Windows);
+        # where case variants coexist, the canonical spelling wins.
+        names = set(names)
+        index = {name.casefold(): name for name in names}
+        for name in (*cls.IMAGE_FILES.values(), *cls.METADATA_FILES):
+            if name in names:
+                index[name.casefold()] = name
+        return index
+
+    def _reindex_entries(self) -> None:
+        self._slug_index = {entry.slug: i for i, entry in enumerate(self.entries)}
+
+    def _row_of(self, entry: BridalEntry) -> int:
+        return self._slug_index.get(entry.slug, -1)
+
+    def _current_row(self) -> int:
+        return self.entry_list.currentIndex().row()
+
+    def _set_current_row(self, row: int) -> None:
+        self.entry_list.setCurrentIndex(self.entry_model.index(row))
+
+    def _on_current_row_changed(self, current: QtCore.QModelIndex, _previous: QtCore.QModelIndex) -> None:
+        self.render_preview(current.row())
 
     def render_preview(self, index: int) -> None:
         if index < 0 or index >= len(self.entries):
@@ -180,10 +745,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 except OSError:
                     return ""
             try:
-                data = path.read_bytes()
-                encoded = base64.b64encode(data).decode("ascii")
-                suffix = path.suffix.lower().strip(".") or "jpeg"
-                return f"data:image/{suffix};base64,{encoded}"
+                stat = path.stat()
+                return _encode_file(str(path), stat.st_mtime_ns, stat.st_size)
             except OSError:
                 return ""
 
@@ -194,62 +757,25 @@ class MainWindow(QtWidgets.QMainWindow):
             "detail2": to_uri(entry.detail2),
         }
         desc_html = self._build_description_html(entry)
-        slug_html = self._render_inline(entry.slug)
-        name_html = self._render_inline(entry.name)
-        price_html = self._render_inline(entry.price)
-        alt_name = self._render_inline(entry.name)
-        return f"""
-        <style>
-        :root {{
-            --ink:#35241a;
-            --accent:#c19273;
-            --veil:#faf3eb;
-        }}
-        .page {{
-            background:linear-gradient(135deg,#f9f3ec 0%,#f2e5d8 100%);
-            padding:1.8rem;
-            border-radius:26px;
-            display:grid;
-            grid-template-columns:minmax(0,38%) minmax(0,62%);
-            gap:1.2rem;
-            min-height:260px;
-            font-family:'Cormorant Garamond','Palatino Linotype','Times New Roman',serif;
-            color:var(--ink);
-            box-shadow:0 25px 55px rgba(54,34,17,0.12);
-        }}
-        .info{{display:flex;flex-direction:column;gap:0.9rem;min-height:100%;}}
-        .info h2{{margin:0;font-size:2.2rem;letter-spacing:0.08em;font-weight:500;}}
-        .info p{{margin:0 0 0.4rem;font-size:1.05rem;line-height:1.7;}}
-        .tag{{text-transform:uppercase;letter-spacing:0.5em;font-size:0.75rem;color:rgba(0,0,0,0.45);font-family:'Optima','Cormorant Garamond','Times New Roman',serif;}}
-        .photos{{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));grid-template-rows:minmax(0,1fr) minmax(0,0.6fr);gap:0.7rem;}}
-        figure{{margin:0;border-radius:18px;overflow:hidden;position:relative;background:#dcd6cf;box-shadow:0 15px 40px rgba(0,0,0,0.12);}}
-        figure img{{width:100%;height:100%;object-fit:cover;display:block;}}
-        figure figcaption{{position:absolute;bottom:8px;left:14px;font-size:0.7rem;letter-spacing:0.2em;color:rgba(255,255,255,0.7);text-shadow:0 2px 6px rgba(0,0,0,0.45);}}
-        .price{{margin-top:auto;align-self:flex-end;font-size:1.5rem;color:var(--accent);letter-spacing:0.3em;text-transform:uppercase;font-weight:500;}}
-        .desc-grid{{display:grid;grid-template-columns:repeat(auto-fit,minmax(160px,1fr));gap:0.8rem;}}
-        .desc-grid article{{background:rgba(255,255,255,0.65);padding:0.9rem;border-radius:18px;box-shadow:0 12px 35px rgba(0,0,0,0.08);}}
-        .desc-grid article h3{{margin:0 0 0.5rem;font-size:0.9rem;letter-spacing:0.15em;color:var(--accent);text-transform:uppercase;}}
-        .desc-grid article p{{margin:0;font-size:0.95rem;line-height:1.6;}}
-        </style>
-        <section class='page'>
-            <div class='info'>
-                <div>
-                    <div class='tag'>{slug_html}</div>
-                    <h2>{name_html}</h2>
-                    {desc_html}
-                </div>
-                <div class='price'>价格 ¥{price_html}</div>
-            </div>
-            <div class='photos'>
-                <figure><img src="{images.get('front', '')}" alt="{alt_name} 主图正面" /></figure>
-                <figure><img src="{images.get('back', '')}" alt="{alt_name} 主图背面" /></figure>
-                <figure><img src="{images.get('detail1', '')}" alt="{alt_name} 细节一" /><figcaption>DETAIL</figcaption></figure>
-                <figure><img src="{images.get('detail2', '')}" alt="{alt_name} 细节二" /><figcaption>DETAIL</figcaption></figure>
-            </div>
-        </section>
-        """
+        slug_html = _render_inline(entry.slug)
+        name_html = _render_inline(entry.name)
+        price_html = _render_inline(entry.price)
+        alt_name = _render_inline(entry.name)
+        return self.PAGE_TEMPLATE.substitute(
+            slug=slug_html,
+            name=name_html,
+            desc=desc_html,
+            price=price_html,
+            alt=alt_name,
+            front=images["front"],
+            back=images["back"],
+            detail1=images["detail1"],
+            detail2=images["detail2"],
+        )
 
     def export_html(self) -> None:
+        if self._export_worker is not None:
+            return
         if not self.entries:
             QtWidgets.QMessageBox.information(self, "提示", "请先加载素材。")
             return
@@ -258,11 +784,39 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not output_file:
             return
-        pages_html = "".join(self.render_page(entry, use_file_uri=True) for entry in self.entries)
-        html = f"<!DOCTYPE html><html lang='zh-CN'><head><meta charset='UTF-8'><title>婚纱目录预览</title></head><body style=\"font-family:'PingFang SC','Microsoft Yahei',sans-serif;background:#f4efe7;padding:20px;\">{pages_html}</body></html>"
-        Path(output_file).write_text(html, encoding="utf-8")
+        worker = ExportWorker(
+            list(self.entries),
+            output_file,
+            functools.partial(self.render_page, use_file_uri=True),
+            self.EXPORT_HEAD,
+            self.EXPORT_TAIL,
+        )
+        progress = QtWidgets.QProgressDialog("正在导出…", None, 0, len(worker.entries), self)
+        progress.setWindowTitle("导出 HTML")
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+        worker.signals.progress.connect(progress.setValue)
+        worker.signals.finished.connect(self._on_export_finished)
+        worker.signals.failed.connect(self._on_export_failed)
+        self._export_worker = worker
+        self._export_progress = progress
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_export_finished(self, output_file: str) -> None:
+        self._end_export()
         QtWidgets.QMessageBox.information(self, "完成", f"已导出到 {output_file}")
 
+    def _on_export_failed(self, message: str) -> None:
+        self._end_export()
+        QtWidgets.QMessageBox.critical(self, "导出失败", f"导出 HTML 时出错：{message}")
+
+    def _end_export(self) -> None:
+        if self._export_progress is not None:
+            self._export_progress.close()
+        self._export_progress = None
+        self._export_worker = None
+
     def create_entry(self) -> None:
         try:
             template_root = self._get_template_root()
@@ -275,22 +829,24 @@ class MainWindow(QtWidgets.QMainWindow):
         data = dialog.get_data()
         target_dir = self._make_unique_dir(template_root, data["name"])
         target_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copy(data["front"], target_dir / "主图正面.jpg")
-        shutil.copy(data["back"], target_dir / "主图背面.jpg")
-        shutil.copy(data["detail1"], target_dir / "细节图一.jpg")
-        shutil.copy(data["detail2"], target_dir / "细节图二.jpg")
+        for key, filename in self.IMAGE_FILES.items():
+            shutil.copyfile(data[key], target_dir / filename)
         metadata = {
             "name": data["name"],
             "description": data["desc"],
             "price": data["price"],
         }
-        (target_dir / "信息.json").write_text(
-            json.dumps(metadata, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
-        self.load_entries()
+        (target_dir / "信息.json").write_bytes(_json_dumps(metadata))
+        self._invalidate_render_caches()
+        new_entry = self._read_entry(target_dir)
+        if new_entry is None:
+            return
+        row = len(self.entries)
+        self.entry_model.insert_entry(row, new_entry)
+        self._set_current_row(row)
 
     def delete_entry(self, entry: BridalEntry | None = None) -> None:
-        index = self.entry_list.currentRow()
+        index = self._current_row()
         target_entry = entry
         if target_entry is None:
             if index < 0 or index >= len(self.entries):
@@ -298,10 +854,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
             target_entry = self.entries[index]
         else:
-            try:
-                index = self.entries.index(target_entry)
-            except ValueError:
-                index = next((i for i, item in enumerate(self.entries) if item.slug == target_entry.slug), -1)
+            index = self._row_of(target_entry)
         reply = QtWidgets.QMessageBox.question(
             self,
             "确认删除",
@@ -319,26 +872,27 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "删除失败", f"删除 {target_entry.name} 时出错：{exc}")
             return
-        self.load_entries()
+        self._invalidate_render_caches()
+        if index < 0:
+            self.load_entries()
+            return
+        self.entry_model.remove_entry(index)
         if self.entries:
-            self.entry_list.setCurrentRow(min(max(index, 0), len(self.entries) - 1))
+            self._set_current_row(min(index, len(self.entries) - 1))
         else:
             self.editor.clear()
 
     def edit_entry(self, entry: BridalEntry | None = None) -> None:
-        index = self.entry_list.currentRow()
+        index = self._current_row()
         target_entry = entry
         if target_entry is None:
             if index < 0 or index >= len(self.entries):
                 QtWidgets.QMessageBox.information(self, "提示", "请先选择要编辑的产品。")
                 return
             target_entry = self.entries[index]
-        try:
-            row = self.entries.index(target_entry)
-        except ValueError:
-            row = next((i for i, item in enumerate(self.entries) if item.slug == target_entry.slug), -1)
+        row = self._row_of(target_entry)
         if row >= 0:
-            self.entry_list.setCurrentRow(row)
+            self._set_current_row(row)
         self.editor.focus_first_field()
 
     def apply_editor_changes(self, entry: BridalEntry, data: dict) -> None:
@@ -352,16 +906,26 @@ class MainWindow(QtWidgets.QMainWindow):
         raw_meta = entry.raw_metadata if isinstance(entry.raw_metadata, (dict, str)) else None
         try:
             self._write_metadata(metadata_path, data, raw_meta)
-            self._apply_image_updates(target_dir, data)
+            self._apply_image_updates(entry, target_dir, data)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "编辑失败", f"更新 {entry.name} 时出错：{exc}")
             return
-        previous_slug = entry.slug
-        self.load_entries()
-        if self.entries:
-            new_index = next((i for i, item in enumerate(self.entries) if item.slug == previous_slug), None)
-            if new_index is not None:
-                self.entry_list.setCurrentRow(new_index)
+        self._invalidate_render_caches()
+        row = self._row_of(entry)
+        updated = self._read_entry(target_dir)
+        if row < 0 or updated is None:
+            self.load_entries()
+            return
+        self.entry_model.replace_entry(row, updated)
+        if self._current_row() == row:
+            self.render_preview(row)
+        else:
+            self._set_current_row(row)
+
+    def _invalidate_render_caches(self) -> None:
+        _data_uri_cache.clear()
+        _render_inline.cache_clear()
+        _render_paragraph.cache_clear()
 
     @staticmethod
     def _make_unique_dir(root: Path, base_name: str) -> Path:
@@ -384,10 +948,11 @@ class MainWindow(QtWidgets.QMainWindow):
         template_root.mkdir(parents=True, exist_ok=True)
         return template_root
 
-    def _load_metadata(self, folder: Path) -> tuple[dict, Path, Any]:
-        for file_name in ("信息.json", "信息.txt"):
-            path = folder / file_name
-            if path.exists():
+    def _load_metadata(self, folder: Path, file_names: dict[str, str]) -> tuple[dict, Path, Any]:
+        for file_name in self.METADATA_FILES:
+            on_disk = file_names.get(file_name.casefold())
+            if on_disk is not None:
+                path = folder / on_disk
                 normalized, raw_meta = self._parse_metadata_file(path)
                 return normalized, path, raw_meta
         raise ValueError("缺少信息文件")
@@ -402,7 +967,7 @@ class MainWindow(QtWidgets.QMainWindow):
         looks_like_json = path.suffix.lower() == ".json" or text.lstrip().startswith("{")
         if looks_like_json:
             try:
-                raw = json.loads(text)
+                raw = _json_loads(text)
             except json.JSONDecodeError as exc:
                 raise ValueError(f"JSON 解析失败：{exc.msg}") from exc
             return self._normalize_metadata(raw), raw
@@ -523,7 +1088,7 @@ class MainWindow(QtWidgets.QMainWindow):
         path.parent.mkdir(parents=True, exist_ok=True)
         if path.suffix.lower() == ".json":
             payload = self._prepare_json_payload(raw_meta, data)
-            path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            path.write_bytes(_json_dumps(payload))
         else:
             path.write_text(self._build_legacy_text(data), encoding="utf-8")
 
@@ -561,36 +1126,34 @@ class MainWindow(QtWidgets.QMainWindow):
             blocks.append(" ".join(current))
         return blocks
 
-    def _apply_image_updates(self, target_dir: Path, data: dict) -> None:
-        mapping = {
-            "front": "主图正面.jpg",
-            "back": "主图背面.jpg",
-            "detail1": "细节图一.jpg",
-            "detail2": "细节图二.jpg",
-        }
-        for key, filename in mapping.items():
+    def _apply_image_updates(self, entry: BridalEntry, target_dir: Path, data: dict) -> None:
+        for key in self.IMAGE_FILES:
             src = data.get(key)
-            if src:
-                shutil.copy(src, target_dir / filename)
-
-    @staticmethod
-    def _render_inline(value: str) -> str:
-        return html.escape(value, quote=True) if value else ""
-
-    def _render_paragraph(self, value: str) -> str:
-        if not value:
-            return ""
-        return html.escape(value, quote=True).replace("\n", "<br />")
+            if not src:
+                continue
+            # Overwrite the file the entry was loaded from so a differently-cased original isn't left behind.
+            dest = target_dir / getattr(entry, key).name
+            src_path = Path(src).resolve()
+            if dest.exists():
+                if src_path == dest.resolve():
+                    continue
+                src_stat = src_path.stat()
+                dest_stat = dest.stat()
+                if src_stat.st_size == dest_stat.st_size and src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+                    continue
+            shutil.copyfile(src, dest)
 
     def _build_description_html(self, entry: BridalEntry) -> str:
         blocks: List[str] = []
         if entry.description:
-            blocks.append(f"<p>{self._render_paragraph(entry.description)}</p>")
+            blocks.append(f"<p>{_render_paragraph(entry.description)}</p>")
         if entry.description_blocks:
             cards = "".join(
-                f"<article><h3>{self._render_inline(block.title) or '亮点'}</h3><p>{self._render_paragraph(block.content)}</p></article>"
-                for block in entry.description_blocks
-                if block.content
+                [
+                    f"<article><h3>{_render_inline(block.title) or '亮点'}</h3><p>{_render_paragraph(block.content)}</p></article>"
+                    for block in entry.description_blocks
+                    if block.content
+                ]
             )
             if cards:
                 blocks.append(f"<div class='desc-grid'>{cards}</div>")
@@ -598,39 +1161,6 @@ class MainWindow(QtWidgets.QMainWindow):
             return "<p>暂无介绍。</p>"
         return "".join(blocks)
 
-    def _build_entry_item(self, entry: BridalEntry) -> QtWidgets.QWidget:
-        widget = QtWidgets.QWidget()
-        widget.setMinimumHeight(48)
-        layout = QtWidgets.QHBoxLayout(widget)
-        layout.setContentsMargins(10, 4, 10, 4)
-        layout.setSpacing(8)
-        label = QtWidgets.QLabel(entry.slug)
-        label.setStyleSheet("font-weight:500;")
-        label.setMinimumHeight(28)
-        label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-        layout.addWidget(label, 1)
-        layout.setAlignment(label, QtCore.Qt.AlignVCenter)
-
-        def make_tool_button(text: str, tooltip: str, callback) -> QtWidgets.QToolButton:
-            btn = QtWidgets.QToolButton()
-            btn.setObjectName("InlineAction")
-            btn.setText(text)
-            btn.setToolTip(tooltip)
-            btn.setAutoRaise(True)
-            btn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
-            btn.setMinimumWidth(48)
-            btn.setMinimumHeight(30)
-            btn.clicked.connect(callback)
-            return btn
-
-        edit_btn = make_tool_button("编辑", "编辑", lambda _, e=entry: self.edit_entry(e))
-        delete_btn = make_tool_button("删除", "删除", lambda _, e=entry: self.delete_entry(e))
-        layout.setAlignment(edit_btn, QtCore.Qt.AlignVCenter)
-        layout.setAlignment(delete_btn, QtCore.Qt.AlignVCenter)
-        layout.addWidget(edit_btn)
-        layout.addWidget(delete_btn)
-        return widget
-
     def apply_styles(self) -> None:
         self.setStyleSheet(
             """
@@ -641,17 +1171,17 @@ class MainWindow(QtWidgets.QMainWindow):
                 background: #ffffff;
                 border-radius: 18px;
             }
-            QListWidget {
+            QListView {
                 border: none;
                 background: transparent;
                 font-size: 14px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px 10px;
                 border-radius: 10px;
                 margin-bottom: 4px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background: #e6eefc;
                 color: #2b4b85;
             }
@@ -675,19 +1205,6 @@ class MainWindow(QtWidgets.QMainWindow):
             QPushButton#PrimaryButton:hover {
                 background: #3f59d4;
             }
-            QToolButton#InlineAction {
-                border: none;
-                background: transparent;
-                color: #4f6ef7;
-                font-weight: 600;
-                padding: 4px 8px;
-                border-radius: 6px;
-                font-size: 13px;
-            }
-            QToolButton#InlineAction:hover {
-                background: rgba(79, 110, 247, 0.12);
-                color: #2b4b85;
-            }
             QLineEdit, QTextEdit {
                 border: 1px solid #dfe3ec;
                 border-radius: 14px;
@@ -709,24 +1226,31 @@ class MainWindow(QtWidgets.QMainWindow):
                 font-weight: 600;
                 margin-top: 8px;
             }
+            QGraphicsView#ImagePreviews {
+                border: none;
+                background: transparent;
+            }
             """
         )
 
 
 class EntryEditor(QtWidgets.QWidget):
-    IMAGE_FIELDS = [
-        ("front", "主图正面"),
-        ("back", "主图背面"),
-        ("detail1", "细节图一"),
-        ("detail2", "细节图二"),
-    ]
+    IMAGE_FIELDS = IMAGE_FIELDS
+    _EMPTY_PENDING = dict.fromkeys(IMAGE_KEYS, "")
+    _HEADER_TMPL = "编辑：{}".format
+    PREVIEW_SIZE = QtCore.QSize(150, 150)
+    PREVIEW_GAP = 10
+    PREVIEW_TITLE_HEIGHT = 24
 
     def __init__(self, main_window: "MainWindow") -> None:
         super().__init__(main_window)
         self.main_window = main_window
         self.setObjectName("EntryEditor")
         self.current_entry: BridalEntry | None = None
-        self.pending_files: dict[str, str] = {key: "" for key, _ in self.IMAGE_FIELDS}
+        self.pending_files: dict[str, str] = dict.fromkeys(IMAGE_KEYS, "")
+        self._preview_tokens = dict.fromkeys(IMAGE_KEYS, 0)
+        self._preview_signals = PreviewSignals(self)
+        self._preview_signals.loaded.connect(self._on_preview_loaded)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(24, 20, 24, 20)
@@ -755,32 +1279,18 @@ class EntryEditor(QtWidgets.QWidget):
         layout.addLayout(form)
 
         self.images_group = QtWidgets.QGroupBox("图片")
-        image_layout = QtWidgets.QGridLayout(self.images_group)
-        image_layout.setHorizontalSpacing(18)
-        image_layout.setVerticalSpacing(16)
-        self.image_previews: dict[str, QtWidgets.QLabel] = {}
+        self.images_group.setVisible(False)
+        self.image_items: dict[str, QtWidgets.QGraphicsPixmapItem] = {}
+        self.image_placeholders: dict[str, QtWidgets.QGraphicsSimpleTextItem] = {}
+        self.image_origins: dict[str, QtCore.QPointF] = {}
         self.image_buttons: dict[str, QtWidgets.QPushButton] = {}
-        for idx, (key, label_text) in enumerate(self.IMAGE_FIELDS):
-            container = QtWidgets.QVBoxLayout()
-            title = QtWidgets.QLabel(label_text)
-            title.setAlignment(QtCore.Qt.AlignCenter)
-            title.setStyleSheet("font-weight:500;")
-            preview = QtWidgets.QLabel("无图")
-            preview.setAlignment(QtCore.Qt.AlignCenter)
-            preview.setFixedSize(150, 150)
-            preview.setStyleSheet(
-                "border:1px dashed #dcdcdc;border-radius:14px;background:#fafafa;color:#9f9f9f;"
-            )
-            button = QtWidgets.QPushButton("更换…")
-            button.clicked.connect(lambda _, k=key: self._pick_image(k))
-            self.image_previews[key] = preview
-            self.image_buttons[key] = button
-            container.addWidget(title)
-            container.addWidget(preview)
-            container.addWidget(button)
-            row = idx // 2
-            col = idx % 2
-            image_layout.addLayout(container, row, col)
+        self._images_built = False
+        self._file_dialog: QtWidgets.QFileDialog | None = None
+        self._pending_preview_refresh = False
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(0)
+        self._preview_timer.timeout.connect(self._refresh_previews_if_visible)
         layout.addWidget(self.images_group)
 
         self.save_btn = QtWidgets.QPushButton("保存修改")
@@ -790,28 +1300,121 @@ class EntryEditor(QtWidgets.QWidget):
 
         self.setEnabled(False)
 
+    def _ensure_images_built(self) -> None:
+        if self._images_built:
+            return
+        self._images_built = True
+        image_layout = QtWidgets.QVBoxLayout(self.images_group)
+        image_layout.setSpacing(16)
+
+        cell = self.PREVIEW_SIZE
+        pitch_x = cell.width() + self.PREVIEW_GAP
+        pitch_y = self.PREVIEW_TITLE_HEIGHT + cell.height() + self.PREVIEW_GAP
+        scene_width = 2 * cell.width() + self.PREVIEW_GAP
+        scene_height = 2 * (self.PREVIEW_TITLE_HEIGHT + cell.height()) + self.PREVIEW_GAP
+        self.image_scene = QtWidgets.QGraphicsScene(0, 0, scene_width, scene_height, self)
+        self.image_view = QtWidgets.QGraphicsView(self.image_scene)
+        self.image_view.setObjectName("ImagePreviews")
+        self.image_view.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.image_view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.image_view.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.image_view.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        self.image_view.setFixedSize(scene_width, scene_height)
+        image_layout.addWidget(self.image_view, alignment=QtCore.Qt.AlignHCenter)
+
+        border_pen = QtGui.QPen(QtGui.QColor("#dcdcdc"), 1, QtCore.Qt.DashLine)
+        background = QtGui.QBrush(QtGui.QColor("#fafafa"))
+        hint_brush = QtGui.QBrush(QtGui.QColor("#9f9f9f"))
+        title_font = QtGui.QFont(self.font())
+        title_font.setWeight(QtGui.QFont.Medium)
+
+        button_layout = QtWidgets.QGridLayout()
+        button_layout.setHorizontalSpacing(18)
+        button_layout.setVerticalSpacing(10)
+        for idx, (key, label_text) in enumerate(self.IMAGE_FIELDS):
+            row = idx // 2
+            col = idx % 2
+            origin = QtCore.QPointF(col * pitch_x, row * pitch_y + self.PREVIEW_TITLE_HEIGHT)
+
+            title = self.image_scene.addSimpleText(label_text, title_font)
+            title_rect = title.boundingRect()
+            title.setPos(
+                origin.x() + (cell.width() - title_rect.width()) / 2,
+                origin.y() - self.PREVIEW_TITLE_HEIGHT + (self.PREVIEW_TITLE_HEIGHT - title_rect.height()) / 2,
+            )
+
+            frame = QtGui.QPainterPath()
+            frame.addRoundedRect(QtCore.QRectF(origin, QtCore.QSizeF(cell)), 14, 14)
+            self.image_scene.addPath(frame, border_pen, background)
+
+            placeholder = self.image_scene.addSimpleText("无图")
+            placeholder.setBrush(hint_brush)
+            hint_rect = placeholder.boundingRect()
+            placeholder.setPos(
+                origin.x() + (cell.width() - hint_rect.width()) / 2,
+                origin.y() + (cell.height() - hint_rect.height()) / 2,
+            )
+
+            item = QtWidgets.QGraphicsPixmapItem()
+            item.setTransformationMode(QtCore.Qt.SmoothTransformation)
+            self.image_scene.addItem(item)
+
+            button = QtWidgets.QPushButton("更换…")
+            button.setProperty("image_key", key)
+            button.clicked.connect(self._on_pick_clicked)
+            button_layout.addWidget(button, row, col)
+
+            self.image_items[key] = item
+            self.image_placeholders[key] = placeholder
+            self.image_origins[key] = origin
+            self.image_buttons[key] = button
+        image_layout.addLayout(button_layout)
+        self.images_group.updateGeometry()
+        self.images_group.setVisible(True)
+
     def load_entry(self, entry: BridalEntry) -> None:
+        self._ensure_images_built()
         self.current_entry = entry
-        self.pending_files = {key: "" for key, _ in self.IMAGE_FIELDS}
-        self.header_label.setText(f"编辑：{entry.name}")
+        self.pending_files = self._EMPTY_PENDING.copy()
+        self.header_label.setText(self._HEADER_TMPL(entry.name))
         self.name_edit.setText(entry.name)
         self.price_edit.setText(entry.price)
         self.desc_edit.setPlainText(entry.description)
-        for key, _ in self.IMAGE_FIELDS:
-            self._update_image_preview(key)
+        self._pending_preview_refresh = True
+        self._preview_timer.start()
         self.setEnabled(True)
 
     def clear(self) -> None:
-        self.current_entry = None
-        self.pending_files = {key: "" for key, _ in self.IMAGE_FIELDS}
-        self.header_label.setText("请选择左侧婚纱进行编辑")
-        self.name_edit.clear()
-        self.price_edit.clear()
-        self.desc_edit.clear()
-        for label in self.image_previews.values():
-            label.clear()
-            label.setText("无图")
-        self.setEnabled(False)
+        self.setUpdatesEnabled(False)
+        blockers = [QtCore.QSignalBlocker(widget) for widget in (self.name_edit, self.price_edit, self.desc_edit)]
+        try:
+            self.current_entry = None
+            self.pending_files = self._EMPTY_PENDING.copy()
+            self._pending_preview_refresh = False
+            self.header_label.setText("请选择左侧婚纱进行编辑")
+            self.name_edit.clear()
+            self.price_edit.clear()
+            self.desc_edit.clear()
+            for key in self.image_items:
+                self._preview_tokens[key] += 1
+                self._set_preview(key, QtGui.QPixmap())
+            self.setEnabled(False)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.setUpdatesEnabled(True)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        if self._pending_preview_refresh:
+            self._preview_timer.start()
+
+    def _refresh_previews_if_visible(self) -> None:
+        if not self._pending_preview_refresh or not self.images_group.isVisible():
+            return
+        self._pending_preview_refresh = False
+        for key in IMAGE_KEYS:
+            self._update_image_preview(key)
 
     def focus_first_field(self) -> None:
         if self.isEnabled():
@@ -833,16 +1436,20 @@ class EntryEditor(QtWidgets.QWidget):
         data.update(self.pending_files)
         self.main_window.apply_editor_changes(self.current_entry, data)
 
+    def _on_pick_clicked(self) -> None:
+        self._pick_image(self.sender().property("image_key"))
+
     def _pick_image(self, key: str) -> None:
-        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "选择图片", "", "Images (*.png *.jpg *.jpeg)")
-        if not file_path:
+        if self._file_dialog is None:
+            self._file_dialog = _make_image_dialog(self)
+        if not self._file_dialog.exec():
             return
+        file_path = self._file_dialog.selectedFiles()[0]
         self.pending_files[key] = file_path
         self._update_image_preview(key)
 
     def _update_image_preview(self, key: str) -> None:
-        label = self.image_previews.get(key)
-        if not label:
+        if key not in self.image_items:
             return
         source: str | Path
         pending = self.pending_files.get(key)
@@ -852,14 +1459,55 @@ class EntryEditor(QtWidgets.QWidget):
             source = getattr(self.current_entry, key)
         else:
             source = ""
-        pixmap = QtGui.QPixmap(str(source)) if source else QtGui.QPixmap()
+        self._preview_tokens[key] += 1
+        dpr = self.image_view.devicePixelRatioF()
+        target_size = self.PREVIEW_SIZE * dpr
+        cache_key = _preview_cache_key(str(source), target_size) if source else None
+        if cache_key is None:
+            self._set_preview(key, QtGui.QPixmap())
+            return
+        cached = QtGui.QPixmapCache.find(cache_key)
+        if cached is not None and not cached.isNull():
+            self._set_preview(key, cached)
+            return
+        # Blank the cell while decoding; "无图" is reserved for missing or unreadable files.
+        self._set_preview(key, QtGui.QPixmap(), show_placeholder=False)
+        loader = PreviewLoader(
+            self._preview_signals,
+            self._preview_tokens,
+            key,
+            self._preview_tokens[key],
+            str(source),
+            cache_key,
+            target_size,
+            dpr,
+        )
+        QtCore.QThreadPool.globalInstance().start(loader)
+
+    def _on_preview_loaded(self, key: str, token: int, cache_key: str, image: QtGui.QImage) -> None:
+        current = token == self._preview_tokens.get(key)
+        if image.isNull():
+            if current:
+                self._set_preview(key, QtGui.QPixmap())
+            return
+        pixmap = QtGui.QPixmap.fromImage(image, QtCore.Qt.ColorOnly | QtCore.Qt.ThresholdDither)
+        # Cache stale results too, so revisiting that entry doesn't decode again.
+        QtGui.QPixmapCache.insert(cache_key, pixmap)
+        if current:
+            self._set_preview(key, pixmap)
+
+    def _set_preview(self, key: str, pixmap: QtGui.QPixmap, show_placeholder: bool = True) -> None:
+        item = self.image_items[key]
+        item.setPixmap(pixmap)
+        self.image_placeholders[key].setVisible(show_placeholder and pixmap.isNull())
         if pixmap.isNull():
-            label.setPixmap(QtGui.QPixmap())
-            label.setText("无图")
-        else:
-            scaled = pixmap.scaled(label.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-            label.setPixmap(scaled)
-            label.setText("")
+            return
+        origin = self.image_origins[key]
+        size = QtCore.QSizeF(pixmap.size()) / pixmap.devicePixelRatio()
+        item.setPos(
+            origin.x() + (self.PREVIEW_SIZE.width() - size.width()) / 2,
+            origin.y() + (self.PREVIEW_SIZE.height() - size.height()) / 2,
+        )
 
 
 class NewEntryDialog(QtWidgets.QDialog):
@@ -874,8 +1522,7 @@ class NewEntryDialog(QtWidgets.QDialog):
         self.name_edit = QtWidgets.QLineEdit()
         self.price_edit = QtWidgets.QLineEdit()
         self.desc_edit = QtWidgets.QTextEdit()
-        self.file_paths = {"front": "", "back": "", "detail1": "", "detail2": ""}
-        self.file_buttons: dict[str, QtWidgets.QPushButton] = {}
+        self.file_paths = dict.fromkeys(IMAGE_KEYS, "")
         self.button_defaults: dict[str, str] = {}
 
         layout.addWidget(QtWidgets.QLabel("婚纱名称"))
@@ -890,20 +1537,13 @@ class NewEntryDialog(QtWidgets.QDialog):
 
         layout.addSpacing(6)
         layout.addWidget(QtWidgets.QLabel("上传图片"))
-        self.front_btn = QtWidgets.QPushButton("选择主图正面")
-        self.back_btn = QtWidgets.QPushButton("选择主图背面")
-        self.detail1_btn = QtWidgets.QPushButton("选择细节图一")
-        self.detail2_btn = QtWidgets.QPushButton("选择细节图二")
-
-        self.file_buttons = {
-            "front": self.front_btn,
-            "back": self.back_btn,
-            "detail1": self.detail1_btn,
-            "detail2": self.detail2_btn,
+        self.file_buttons: dict[str, QtWidgets.QPushButton] = {
+            key: QtWidgets.QPushButton(f"选择{label}") for key, label in IMAGE_FIELDS
         }
+        self._buttons_wired = False
+        self._file_dialog: QtWidgets.QFileDialog | None = None
         for key, btn in self.file_buttons.items():
             self.button_defaults[key] = btn.text()
-            btn.clicked.connect(lambda _, k=key, b=btn: self.pick_file(k, b))
             layout.addWidget(btn)
 
         buttons = QtWidgets.QDialogButtonBox(
@@ -917,15 +1557,36 @@ class NewEntryDialog(QtWidgets.QDialog):
         if existing:
             self._prefill_existing(existing)
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        if not self._buttons_wired:
+            QtCore.QTimer.singleShot(0, self._wire_buttons)
+
+    def _wire_buttons(self) -> None:
+        if self._buttons_wired:
+            return
+        self._buttons_wired = True
+        for key, btn in self.file_buttons.items():
+            btn.setProperty("image_key", key)
+            btn.clicked.connect(self._on_file_button_clicked)
+
+    def _on_file_button_clicked(self) -> None:
+        button = self.sender()
+        self.pick_file(button.property("image_key"), button)
+
     def pick_file(self, key: str, button: QtWidgets.QPushButton) -> None:
-        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "选择图片", "", "Images (*.png *.jpg *.jpeg)")
-        if file_path:
+        if self._file_dialog is None:
+            self._file_dialog = _make_image_dialog(self)
+        if self._file_dialog.exec():
+            file_path = self._file_dialog.selectedFiles()[0]
             self.file_paths[key] = file_path
-            button.setText(Path(file_path).name)
+            button.setText(os.path.basename(file_path))
 
     def accept(self) -> None:
-        if self.require_images and not all(self.file_paths.values()):
-            QtWidgets.QMessageBox.warning(self, "提示", "四张图片必须全部选择。")
+        missing = next((key for key, value in self.file_paths.items() if not value), None)
+        if self.require_images and missing:
+            label = dict(IMAGE_FIELDS).get(missing, missing)
+            QtWidgets.QMessageBox.warning(self, "提示", f"请选择{label}图片。")
             return
         if not self.name_edit.text().strip():
             QtWidgets.QMessageBox.warning(self, "提示", "请填写婚纱名称。")
@@ -961,6 +1622,7 @@ class NewEntryDialog(QtWidgets.QDialog):
 
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
+    QtGui.QPixmapCache.setCacheLimit(32 * 1024)
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())